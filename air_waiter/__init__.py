@@ -1,10 +1,39 @@
 from __future__ import annotations
 
-from .wait import UnlimitedWaiterError, UnusedMaxIntervalError, Wait, WaiterTimeoutError
+from .wait import (
+    AsyncActionError,
+    AsyncWait,
+    NotNotifiableWaiterError,
+    UnlimitedWaiterError,
+    UnusedMaxIntervalError,
+    UnusedNotifiableError,
+    UnusedResultsMaxlenError,
+    UnusedSpinThresholdError,
+    Wait,
+    WaiterTimeoutError,
+    WrongBatchSizeError,
+    WrongIntervalError,
+    WrongMaxAttemptsError,
+    WrongMaxIntervalError,
+    WrongResultsMaxlenError,
+    WrongSpinThresholdError,
+)
 
 __all__ = [
+    "AsyncActionError",
+    "AsyncWait",
+    "NotNotifiableWaiterError",
     "UnlimitedWaiterError",
     "UnusedMaxIntervalError",
+    "UnusedNotifiableError",
+    "UnusedResultsMaxlenError",
+    "UnusedSpinThresholdError",
     "Wait",
     "WaiterTimeoutError",
+    "WrongBatchSizeError",
+    "WrongIntervalError",
+    "WrongMaxAttemptsError",
+    "WrongMaxIntervalError",
+    "WrongResultsMaxlenError",
+    "WrongSpinThresholdError",
 ]
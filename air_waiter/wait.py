@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import operator
+import sys
+import threading
 import time
-from contextlib import suppress
+from collections import deque
+from collections.abc import Awaitable
 from functools import partial
 from time import sleep
 from typing import Any, Literal, TYPE_CHECKING
@@ -11,6 +16,33 @@ if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Callable
 
 
+NS_IN_SECOND = 1_000_000_000
+# Saturation limit for the exponential delay without max_interval (~146 years) to stop growing the integer
+MAX_DELAY_NS = 1 << 62
+# Remaining time of a waiter without timeout, always longer than any delay
+UNLIMITED_TIMEOUT_NS = MAX_DELAY_NS << 1
+
+
+def _seconds_to_ns(seconds: float, limit_ns: int) -> int:
+    """Convert seconds to nanoseconds, infinite or longer than the limit time is converted to the limit."""
+    ns = seconds * NS_IN_SECOND
+    return int(ns) if ns < limit_ns else limit_ns
+
+
+def _spin(duration_ns: int) -> None:
+    """Busy-wait for the given time without giving control to the scheduler."""
+    monotonic_ns = time.monotonic_ns
+    end_ns = monotonic_ns() + duration_ns
+    while monotonic_ns() < end_ns:
+        pass
+
+
+def _wait_event(event: threading.Event, seconds: float) -> None:
+    """Wait for the event to be set or for the given time and clear it for the next wait."""
+    event.wait(timeout=seconds)
+    event.clear()
+
+
 class UnlimitedWaiterError(Exception):
     def __init__(self) -> None:
         super().__init__("Wrong waiter configuration: endless timeout is not allowed with not limited attempts")
@@ -21,15 +53,209 @@ class UnusedMaxIntervalError(Exception):
         super().__init__("Wrong waiter configuration: max_interval should be used with is_exponential `True`")
 
 
-class WaiterTimeoutError(Exception):
-    pass
+class UnusedResultsMaxlenError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: results_maxlen should be used with debug `True`")
+
+
+class WrongResultsMaxlenError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: results_maxlen should not be negative")
+
+
+class WrongMaxAttemptsError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: max_attempts should not be negative")
+
+
+class WrongSpinThresholdError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: spin_threshold should not be negative")
+
+
+class WrongIntervalError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: interval should not be negative")
+
+
+class WrongMaxIntervalError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: max_interval should not be negative")
+
+
+class UnusedSpinThresholdError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: spin_threshold should not be used with AsyncWait")
+
+
+class UnusedNotifiableError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: notifiable should not be used with AsyncWait")
+
+
+class WrongBatchSizeError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: batch_size should be at least 1")
+
+
+class NotNotifiableWaiterError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: notify should be used with notifiable `True`")
+
+
+class AsyncActionError(Exception):
+    def __init__(self) -> None:
+        super().__init__("Wrong waiter configuration: coroutine function action should be used with AsyncWait")
 
 
 class NoResult:
     pass
 
 
-class Wait[T]:
+class WaiterTimeoutError(Exception):
+    def __init__(
+        self,
+        *,
+        calls_count: int,
+        last_result: Any = NoResult,
+        results: list[Any] | None = None,
+        timeout_message: str = "",
+    ) -> None:
+        """Waiter timeout error with the message formatted only when it is shown.
+
+        Results are not copied deeply, so the message shows them as they are when it is formatted.
+        A result mutated after the timeout is shown mutated.
+
+        :param calls_count: Action calls count made by the waiter
+        :param last_result: Last result of the action, NoResult if the action never returned
+        :param results: All saved results of the action, None if they were not saved
+        :param timeout_message: Custom message to show before the waiter details
+        """
+        super().__init__(calls_count, last_result, results, timeout_message)
+        self.calls_count = calls_count
+        self.last_result = last_result
+        self.results = results
+        self.timeout_message = timeout_message
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (
+            partial(
+                type(self),
+                calls_count=self.calls_count,
+                last_result=self.last_result,
+                results=self.results,
+                timeout_message=self.timeout_message,
+            ),
+            (),
+        )
+
+    def __str__(self) -> str:
+        msg_parts = (
+            self.timeout_message,
+            f"Waiter timeout after {self.calls_count} action calls",
+            f"Last result: {self.last_result}" if self.last_result is not NoResult else "",
+            f"Results: {self.results}" if self.results is not None else "",
+        )
+        return "\n".join(msg_part for msg_part in msg_parts if msg_part)
+
+
+class _BaseWait[R]:
+    __slots__ = (
+        "__weakref__",
+        "_action",
+        "_batch_size",
+        "_calls_count",
+        "_debug",
+        "_exceptions_to_ignore",
+        "_interval_ns",
+        "_max_attempts",
+        "_max_delay_ns",
+        "_results",
+        "_timeout_message",
+        "_timeout_ns",
+    )
+
+    # Constant predicate is bound once instead of building a partial on every wait
+    _IS_NOT_NONE = partial(operator.is_not, None)
+
+    def __init__(  # noqa: PLR0913
+        self,
+        action: Callable[..., R],
+        *args: Any,
+        timeout: float,
+        max_attempts: int = 0,
+        exceptions_to_ignore: tuple[type[Exception], ...] = (),
+        interval: float = 0.1,
+        is_exponential: bool = False,
+        max_interval: float = 0,
+        timeout_message: str = "",
+        debug: bool = False,
+        results_maxlen: int = 0,
+        batch_size: int = 1,
+        **kwargs: Any,
+    ) -> None:
+        """Configuration shared by Wait and AsyncWait, arguments are described in `Wait.__init__`."""
+        self._action = partial(action, *args, **kwargs) if args or kwargs else action
+
+        if max_attempts < 0:
+            raise WrongMaxAttemptsError
+        if timeout <= 0 and max_attempts == 0:
+            raise UnlimitedWaiterError
+
+        # Limits are normalized here so that the polling loop checks them unconditionally
+        self._timeout_ns = _seconds_to_ns(timeout, UNLIMITED_TIMEOUT_NS) if timeout > 0 else UNLIMITED_TIMEOUT_NS
+        self._max_attempts = max_attempts or sys.maxsize
+        if interval < 0:
+            raise WrongIntervalError
+        self._interval_ns = _seconds_to_ns(interval, MAX_DELAY_NS)
+        self._exceptions_to_ignore = exceptions_to_ignore
+
+        if max_interval < 0:
+            raise WrongMaxIntervalError
+        if not is_exponential and max_interval != 0:
+            raise UnusedMaxIntervalError
+
+        # Delay stops growing when it reaches the limit, so a fixed interval is saturated from the start
+        if is_exponential:
+            self._max_delay_ns = _seconds_to_ns(max_interval, MAX_DELAY_NS) or MAX_DELAY_NS
+        else:
+            self._max_delay_ns = self._interval_ns
+        self._timeout_message = timeout_message
+        self._debug = debug
+
+        if batch_size < 1:
+            raise WrongBatchSizeError
+        self._batch_size = batch_size
+
+        if results_maxlen < 0:
+            raise WrongResultsMaxlenError
+        if not debug and results_maxlen != 0:
+            raise UnusedResultsMaxlenError
+
+        self._calls_count = 0
+        self._results: deque[Any] = deque(maxlen=results_maxlen or None)
+
+    def _reset(self) -> None:
+        """Reset the waiter state left from the previous wait: calls count and saved results.
+
+        Saved results container is cleared instead of being created again.
+        A pending notification is kept to not lose `notify` called right before the wait.
+        """
+        self._calls_count = 0
+        self._results.clear()
+
+    def _timeout_error(self, calls_count: int, result: Any, results: deque[Any] | None) -> WaiterTimeoutError:
+        return WaiterTimeoutError(
+            calls_count=calls_count,
+            last_result=result,
+            results=list(results) if results is not None else None,
+            timeout_message=self._timeout_message,
+        )
+
+
+class Wait[T](_BaseWait[T]):
+    __slots__ = ("_event", "_spin_threshold_ns")
+
     def __init__(  # noqa: PLR0913
         self,
         action: Callable[..., T],
@@ -42,6 +268,10 @@ class Wait[T]:
         max_interval: float = 0,
         timeout_message: str = "",
         debug: bool = False,
+        results_maxlen: int = 0,
+        spin_threshold: float = 0,
+        notifiable: bool = False,
+        batch_size: int = 1,
         **kwargs: Any,
     ) -> None:
         """Waiter logic class to call a callable until the expected result.
@@ -50,84 +280,121 @@ class Wait[T]:
         If the remaining time till timeout is less then interval to sleep,
         waiter will sleep remaining time only and do the last call.
 
-        :param action: Callable to call
+        The same waiter can be reused for repeated waits, every `until_*` call starts from a clean state.
+        A waiter runs one wait at a time: concurrent waits on the same instance share calls count
+        and saved results, so use separate waiters for them.
+
+        :param action: Callable to call. Coroutine functions are not allowed, use AsyncWait for them
         :param args: Positional args for the action
         :param timeout: Maximal time in seconds to wait. 0 to wait without limit by time.
             0 is allowed only with max_attempts != 0.
-        :param max_attempts: Maximal calls count. 0 to call without limit by count
+        :param max_attempts: Maximal calls count. 0 to call without limit by count. Negative values are not allowed
         :param exceptions_to_ignore: Exceptions which will be ignored if happen during the action call
         :param interval: Polling interval in seconds between calls of an action
-        :param is_exponential: Exponential waiter doubles interval after every call
+        :param is_exponential: Exponential waiter doubles interval after every call,
+            or after every batch of calls if batch_size > 1
         :param max_interval: Limit in seconds for the exponential waiter. Is used only with is_exponential = True.
             0 to ignore and increase interval endlessly
         :param timeout_message: message in case of waiter is failed
         :param debug: save all results of action while polling and show them in timeout exception if happens
+        :param results_maxlen: Keep only this count of the latest results. Is used only with debug = True.
+            0 to keep all results
+        :param spin_threshold: Delays in seconds up to this value are busy-waited instead of sleeping
+            to avoid the scheduler wake-up latency for very short intervals. 0 to always sleep
+        :param notifiable: Allow to wake the waiter up before the interval ends by `notify` call
+            from another thread. The action is called and the result is checked after every wake-up
+        :param batch_size: Calls count to do one after another without sleeping between them.
+            Every call is counted in max_attempts. The batch is stopped when the timeout is reached,
+            the clock is checked between batch calls only if the timeout is set
         :param kwargs: Keyword args for the action
         """
-        self._action = partial(action, *args, **kwargs)
-
-        if timeout <= 0 and max_attempts <= 0:
-            raise UnlimitedWaiterError
-
-        self._timeout = timeout
-        self._max_attempts = max_attempts
-        self._interval = interval
-        self._exceptions_to_ignore = exceptions_to_ignore
-
-        if not is_exponential and max_interval != 0:
-            raise UnusedMaxIntervalError
-
-        self._is_exponential = is_exponential
-        self._max_interval = max_interval
-        self._timeout_message = timeout_message
-        self._debug = debug
-
-        self._calls_count = 0
-        self._results: list[Any] | None = None
-
-    def _poll(self, predicate: Callable[[T], bool]) -> T:
-        self._calls_count = 0
-        if self._debug:
-            self._results = []
-
-        end_time = time.time() + self._timeout
+        if inspect.iscoroutinefunction(action):
+            raise AsyncActionError
+
+        super().__init__(
+            action,
+            *args,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            exceptions_to_ignore=exceptions_to_ignore,
+            interval=interval,
+            is_exponential=is_exponential,
+            max_interval=max_interval,
+            timeout_message=timeout_message,
+            debug=debug,
+            results_maxlen=results_maxlen,
+            batch_size=batch_size,
+            **kwargs,
+        )
+
+        if spin_threshold < 0:
+            raise WrongSpinThresholdError
+        self._spin_threshold_ns = _seconds_to_ns(spin_threshold, MAX_DELAY_NS)
+        self._event = threading.Event() if notifiable else None
+
+    def _poll(self, predicate: Callable[[T], bool] | None = None, expected: Any = None) -> T:  # noqa: C901
+        """Call the action until the predicate is satisfied.
+
+        :param predicate: Callable to check the action result. If not set, the result is compared
+            with `expected` by identity inline, without a predicate call
+        :param expected: Value to compare the action result with by identity if predicate is not set
+        """
+        self._reset()
+
+        action = self._action
+        max_attempts = self._max_attempts
+        batch_size = self._batch_size
+        max_delay_ns = self._max_delay_ns
+        exceptions_to_ignore = self._exceptions_to_ignore
+        results = self._results if self._debug else None
+        spin_threshold_ns = self._spin_threshold_ns
+        _sleep = sleep if self._event is None else partial(_wait_event, self._event)
+        spin = _spin
+        monotonic_ns = time.monotonic_ns
+
+        has_timeout = self._timeout_ns != UNLIMITED_TIMEOUT_NS
+        end_ns = monotonic_ns() + self._timeout_ns
+        delay_ns = min(self._interval_ns, max_delay_ns)
+        calls_count = 0
         result: T | type[NoResult] = NoResult
 
-        while True:
-            remaining_time = end_time - time.time()
-            if (self._timeout > 0 and remaining_time < 0) or (
-                self._max_attempts != 0 and self._calls_count >= self._max_attempts
-            ):
-                break
-
-            if self._is_exponential:
-                interval = self._interval * (2**self._calls_count)
-                delay = min(interval, self._max_interval) if self._max_interval != 0 else interval
-            else:
-                delay = self._interval
-
-            sleep(min(delay, remaining_time) if self._timeout > 0 else delay)
-            self._calls_count += 1
-
-            with suppress(*self._exceptions_to_ignore):
-                result = self._action()
-                if self._debug and self._results is not None:
-                    self._results.append(result)
-                if predicate(result):
-                    return result
-
-        msg_parts = [
-            msg_part
-            for msg_part in (
-                self._timeout_message,
-                f"Waiter timeout after {self._calls_count} action calls",
-                f"Last result: {result}" if result is not NoResult else "",
-                f"Results: {self._results}" if self._debug else "",
-            )
-            if msg_part
-        ]
-        msg = "\n".join(msg_parts)
-        raise WaiterTimeoutError(msg)
+        try:
+            while True:
+                remaining_ns = end_ns - monotonic_ns()
+                if remaining_ns < 0 or calls_count >= max_attempts:
+                    break
+
+                sleep_ns = min(delay_ns, remaining_ns)
+                if sleep_ns > spin_threshold_ns:
+                    _sleep(sleep_ns / NS_IN_SECOND)
+                elif sleep_ns > 0:
+                    spin(sleep_ns)
+                if delay_ns < max_delay_ns:
+                    delay_ns = min(delay_ns << 1, max_delay_ns)
+
+                for batch_index in range(min(batch_size, max_attempts - calls_count)):
+                    # The first call of a batch is checked against the deadline by the outer loop
+                    if batch_index and has_timeout and monotonic_ns() > end_ns:
+                        break
+                    calls_count += 1
+                    try:
+                        result = action()
+                        if results is not None:
+                            results.append(result)
+                        if (result is expected) if predicate is None else predicate(result):
+                            return result
+                    except exceptions_to_ignore:
+                        continue
+        finally:
+            self._calls_count = calls_count
+
+        raise self._timeout_error(calls_count, result, results)
+
+    def notify(self) -> None:
+        """Wake the waiting notifiable waiter up to call the action without waiting for the interval end."""
+        if self._event is None:
+            raise NotNotifiableWaiterError
+        self._event.set()
 
     def until(self, predicate: Callable[[T], bool] | None = None) -> T:
         return self._poll(predicate=predicate or operator.truth)
@@ -142,23 +409,155 @@ class Wait[T]:
         return self._poll(predicate=partial(operator.ne, value))
 
     def until_is(self, value: T) -> T:
-        return self._poll(predicate=partial(operator.is_, value))
+        return self._poll(expected=value)
 
     def until_is_not(self, value: T) -> T:
         return self._poll(predicate=partial(operator.is_not, value))
 
     def until_is_true(self) -> Literal[True]:
-        return self._poll(predicate=partial(operator.is_, True))  # type: ignore[return-value]  # noqa: FBT003
+        return self._poll(expected=True)  # type: ignore[return-value]
 
     def until_is_false(self) -> Literal[False]:
-        return self._poll(predicate=partial(operator.is_, False))  # type: ignore[return-value]  # noqa: FBT003
+        return self._poll(expected=False)  # type: ignore[return-value]
 
     def until_is_none(self) -> None:
-        return self._poll(predicate=partial(operator.is_, None))  # type: ignore[return-value]
+        return self._poll(expected=None)  # type: ignore[return-value]
 
     def until_is_not_none(self) -> T:
         # TODO: is it possible to constraint this method annotation that it never returns none?
         # without passing action as method argument?
         # action: Callable[..., T | None]
         # https://github.com/airreality/air-waiter/issues/4
-        return self._poll(predicate=partial(operator.is_not, None))
+        return self._poll(predicate=self._IS_NOT_NONE)
+
+
+class AsyncWait[T](_BaseWait[Awaitable[T]]):
+    __slots__ = ()
+
+    def __init__(  # noqa: PLR0913
+        self,
+        action: Callable[..., Awaitable[T]],
+        *args: Any,
+        timeout: float,
+        max_attempts: int = 0,
+        exceptions_to_ignore: tuple[type[Exception], ...] = (),
+        interval: float = 0.1,
+        is_exponential: bool = False,
+        max_interval: float = 0,
+        timeout_message: str = "",
+        debug: bool = False,
+        results_maxlen: int = 0,
+        spin_threshold: float = 0,
+        notifiable: bool = False,
+        batch_size: int = 1,
+        **kwargs: Any,
+    ) -> None:
+        """Waiter logic class to await a coroutine function until the expected result without blocking the event loop.
+
+        Accepts the same arguments as `Wait.__init__`. `spin_threshold` and `notifiable` are not supported:
+        busy-waiting would block the event loop and the async waiter has no `notify`.
+        """
+        if spin_threshold != 0:
+            raise UnusedSpinThresholdError
+        if notifiable:
+            raise UnusedNotifiableError
+
+        super().__init__(
+            action,
+            *args,
+            timeout=timeout,
+            max_attempts=max_attempts,
+            exceptions_to_ignore=exceptions_to_ignore,
+            interval=interval,
+            is_exponential=is_exponential,
+            max_interval=max_interval,
+            timeout_message=timeout_message,
+            debug=debug,
+            results_maxlen=results_maxlen,
+            batch_size=batch_size,
+            **kwargs,
+        )
+
+    async def _poll(self, predicate: Callable[[T], bool] | None = None, expected: Any = None) -> T:
+        """Call the action until the predicate is satisfied without blocking the event loop.
+
+        The event loop is given control between calls even if there is no delay.
+
+        :param predicate: Callable to check the action result. If not set, the result is compared
+            with `expected` by identity inline, without a predicate call
+        :param expected: Value to compare the action result with by identity if predicate is not set
+        """
+        self._reset()
+
+        action = self._action
+        max_attempts = self._max_attempts
+        batch_size = self._batch_size
+        max_delay_ns = self._max_delay_ns
+        exceptions_to_ignore = self._exceptions_to_ignore
+        results = self._results if self._debug else None
+        _sleep = asyncio.sleep
+        monotonic_ns = time.monotonic_ns
+
+        has_timeout = self._timeout_ns != UNLIMITED_TIMEOUT_NS
+        end_ns = monotonic_ns() + self._timeout_ns
+        delay_ns = min(self._interval_ns, max_delay_ns)
+        calls_count = 0
+        result: T | type[NoResult] = NoResult
+
+        try:
+            while True:
+                remaining_ns = end_ns - monotonic_ns()
+                if remaining_ns < 0 or calls_count >= max_attempts:
+                    break
+
+                await _sleep(min(delay_ns, remaining_ns) / NS_IN_SECOND)
+                if delay_ns < max_delay_ns:
+                    delay_ns = min(delay_ns << 1, max_delay_ns)
+
+                for batch_index in range(min(batch_size, max_attempts - calls_count)):
+                    # The first call of a batch is checked against the deadline by the outer loop
+                    if batch_index and has_timeout and monotonic_ns() > end_ns:
+                        break
+                    calls_count += 1
+                    try:
+                        result = await action()
+                        if results is not None:
+                            results.append(result)
+                        if (result is expected) if predicate is None else predicate(result):
+                            return result
+                    except exceptions_to_ignore:
+                        continue
+        finally:
+            self._calls_count = calls_count
+
+        raise self._timeout_error(calls_count, result, results)
+
+    async def until(self, predicate: Callable[[T], bool] | None = None) -> T:
+        return await self._poll(predicate=predicate or operator.truth)
+
+    async def until_not(self) -> T:
+        return await self._poll(predicate=operator.not_)
+
+    async def until_equal_to(self, value: T) -> T:
+        return await self._poll(predicate=partial(operator.eq, value))
+
+    async def until_not_equal_to(self, value: T) -> T:
+        return await self._poll(predicate=partial(operator.ne, value))
+
+    async def until_is(self, value: T) -> T:
+        return await self._poll(expected=value)
+
+    async def until_is_not(self, value: T) -> T:
+        return await self._poll(predicate=partial(operator.is_not, value))
+
+    async def until_is_true(self) -> Literal[True]:
+        return await self._poll(expected=True)  # type: ignore[return-value]
+
+    async def until_is_false(self) -> Literal[False]:
+        return await self._poll(expected=False)  # type: ignore[return-value]
+
+    async def until_is_none(self) -> None:
+        return await self._poll(expected=None)  # type: ignore[return-value]
+
+    async def until_is_not_none(self) -> T:
+        return await self._poll(predicate=self._IS_NOT_NONE)
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import math
+import pickle
 import re
+import threading
 import time
+import weakref
 from typing import Any, TYPE_CHECKING
 
 import pytest
 
-from air_waiter.wait import UnlimitedWaiterError, UnusedMaxIntervalError, Wait, WaiterTimeoutError
+from air_waiter.wait import (
+    AsyncActionError,
+    AsyncWait,
+    NotNotifiableWaiterError,
+    UnlimitedWaiterError,
+    UnusedMaxIntervalError,
+    UnusedNotifiableError,
+    UnusedResultsMaxlenError,
+    UnusedSpinThresholdError,
+    Wait,
+    WaiterTimeoutError,
+    WrongBatchSizeError,
+    WrongIntervalError,
+    WrongMaxAttemptsError,
+    WrongMaxIntervalError,
+    WrongResultsMaxlenError,
+    WrongSpinThresholdError,
+)
 
 if TYPE_CHECKING:
     from pytest_mock import MockFixture
@@ -79,6 +101,128 @@ class TestWait:
             if timeout != 0:
                 assert 0 <= time.perf_counter() - start < timeout
 
+    @staticmethod
+    def test_slots(mocker: MockFixture) -> None:
+        waiter = Wait(mocker.Mock(), timeout=1)
+        assert not hasattr(waiter, "__dict__")
+        assert weakref.ref(waiter)() is waiter
+
+    @staticmethod
+    @pytest.mark.parametrize(("max_attempts", "batch_size"), ((6, 3), (5, 3), (2, 3)))
+    def test_batch_size(mocker: MockFixture, max_attempts: int, batch_size: int) -> None:
+        interval = 0.03
+        action_mock = mocker.Mock(return_value=None)
+        start_time = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            Wait(action_mock, timeout=0, max_attempts=max_attempts, interval=interval, batch_size=batch_size).until()
+
+        assert action_mock.call_count == max_attempts
+        batches_count = -(-max_attempts // batch_size)
+        assert 0 <= time.perf_counter() - start_time - interval * batches_count < MAX_THRESHOLD
+
+    @staticmethod
+    def test_batch_size_async(mocker: MockFixture) -> None:
+        expected_call_count = 3
+        action_mock = mocker.AsyncMock(side_effect=(None, None, True))
+        waiter = AsyncWait(action_mock, timeout=0, max_attempts=4, interval=1, batch_size=3)
+        start_time = time.perf_counter()
+        assert asyncio.run(waiter.until()) is True
+        assert action_mock.await_count == expected_call_count
+        assert 0 <= time.perf_counter() - start_time - 1 < MAX_THRESHOLD
+
+    @staticmethod
+    def test_batch_size_with_timeout(mocker: MockFixture) -> None:
+        timeout, action_time = 0.15, 0.05
+        action_mock = mocker.Mock(side_effect=lambda: time.sleep(action_time))
+        start_time = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            Wait(action_mock, timeout=timeout, interval=0, batch_size=10).until()
+
+        assert 0 <= time.perf_counter() - start_time - timeout <= action_time + MAX_THRESHOLD
+
+    @staticmethod
+    def test_batch_size_with_timeout_async(mocker: MockFixture) -> None:
+        timeout, action_time = 0.15, 0.05
+
+        async def action() -> None:
+            await asyncio.sleep(action_time)
+
+        action_mock = mocker.AsyncMock(side_effect=action)
+        start_time = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            asyncio.run(AsyncWait(action_mock, timeout=timeout, interval=0, batch_size=10).until())
+
+        assert 0 <= time.perf_counter() - start_time - timeout <= action_time + MAX_THRESHOLD
+
+    @staticmethod
+    def test_batch_size_exponential_interval(mocker: MockFixture) -> None:
+        interval, attempts, batch_size, total_interval = 0.02, 6, 2, 0.14
+        action_mock = mocker.Mock(return_value=False)
+        waiter = Wait(
+            action_mock, timeout=0, max_attempts=attempts, interval=interval, is_exponential=True, batch_size=batch_size
+        )
+        start_time = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            waiter.until()
+
+        assert action_mock.call_count == attempts
+        assert 0 <= time.perf_counter() - start_time - total_interval < MAX_THRESHOLD
+
+    @staticmethod
+    def test_batch_size_without_timeout_clock_calls(mocker: MockFixture) -> None:
+        attempts, batch_size = 6, 3
+        # One call for the deadline and one deadline check before every batch and the last one
+        expected_clock_calls = 1 + attempts // batch_size + 1
+        waiter = Wait(
+            mocker.Mock(return_value=False), timeout=0, max_attempts=attempts, interval=0, batch_size=batch_size
+        )
+        clock_mock = mocker.patch("air_waiter.wait.time.monotonic_ns", wraps=time.monotonic_ns)
+        with pytest.raises(WaiterTimeoutError):
+            waiter.until()
+
+        assert clock_mock.call_count == expected_clock_calls
+
+    @staticmethod
+    def test_wrong_batch_size(mocker: MockFixture) -> None:
+        with pytest.raises(WrongBatchSizeError):
+            Wait(mocker.Mock(), timeout=1, batch_size=0)
+
+    @staticmethod
+    def test_infinite_timeout(mocker: MockFixture) -> None:
+        max_attempts = 2
+        action_mock = mocker.Mock(return_value=None)
+        with pytest.raises(WaiterTimeoutError):
+            Wait(action_mock, timeout=math.inf, interval=0, max_attempts=max_attempts).until()
+
+        assert action_mock.call_count == max_attempts
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("interval", "is_exponential", "max_interval"),
+        (
+            (math.inf, False, 0),
+            (math.inf, True, 0),
+            (0.01, True, math.inf),
+        ),
+    )
+    def test_infinite_interval(mocker: MockFixture, interval: float, is_exponential: bool, max_interval: float) -> None:
+        timeout = 0.05
+        action_mock = mocker.Mock(return_value=None)
+        waiter = Wait(
+            action_mock, timeout=timeout, interval=interval, is_exponential=is_exponential, max_interval=max_interval
+        )
+        start = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            waiter.until()
+
+        assert 0 <= time.perf_counter() - start - timeout <= MAX_THRESHOLD
+
+    @staticmethod
+    @pytest.mark.parametrize("timeout", (0, 1))
+    def test_negative_max_attempts(mocker: MockFixture, timeout: float) -> None:
+        with pytest.raises(WrongMaxAttemptsError):
+            Wait(mocker.Mock(), timeout=timeout, max_attempts=-1)
+
     @staticmethod
     def test_unlimited_max_attempts_with_unlimited_timeout(mocker: MockFixture) -> None:
         action_mock = mocker.Mock(return_value=None)
@@ -108,6 +252,69 @@ class TestWait:
 
         assert 0 <= time.perf_counter() - start_time - interval * attempts < MAX_THRESHOLD
 
+    @staticmethod
+    def test_zero_interval_no_sleep(mocker: MockFixture) -> None:
+        attempts = 3
+        action_mock = mocker.Mock(return_value=False)
+        sleep_mock = mocker.patch("air_waiter.wait.sleep")
+        with pytest.raises(WaiterTimeoutError):
+            Wait(action_mock, timeout=0, max_attempts=attempts, interval=0).until()
+
+        assert action_mock.call_count == attempts
+        sleep_mock.assert_not_called()
+
+    @staticmethod
+    def test_spin_threshold(mocker: MockFixture) -> None:
+        interval, attempts = 0.01, 3
+        action_mock = mocker.Mock(return_value=False)
+        sleep_mock = mocker.patch("air_waiter.wait.sleep")
+        start_time = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            Wait(action_mock, timeout=0, max_attempts=attempts, interval=interval, spin_threshold=interval).until()
+
+        assert 0 <= time.perf_counter() - start_time - interval * attempts < MAX_THRESHOLD
+        assert action_mock.call_count == attempts
+        sleep_mock.assert_not_called()
+
+    @staticmethod
+    def test_notify(mocker: MockFixture) -> None:
+        notify_delay = 0.03
+        expected_call_count = 2
+        action_mock = mocker.Mock(side_effect=(False, True))
+        waiter = Wait(action_mock, timeout=2, interval=1, notifiable=True)
+        waiter.notify()
+        timer = threading.Timer(notify_delay, waiter.notify)
+        start_time = time.perf_counter()
+        timer.start()
+        result = waiter.until()
+        timer.join()
+
+        assert result is True
+        assert action_mock.call_count == expected_call_count
+        assert 0 <= time.perf_counter() - start_time - notify_delay < MAX_THRESHOLD
+
+    @staticmethod
+    def test_notify_not_notifiable(mocker: MockFixture) -> None:
+        waiter = Wait(mocker.Mock(), timeout=1)
+        with pytest.raises(NotNotifiableWaiterError):
+            waiter.notify()
+
+    @staticmethod
+    @pytest.mark.parametrize("is_exponential", (True, False))
+    def test_negative_interval(mocker: MockFixture, is_exponential: bool) -> None:
+        with pytest.raises(WrongIntervalError):
+            Wait(mocker.Mock(), timeout=1, interval=-0.01, is_exponential=is_exponential)
+
+    @staticmethod
+    def test_negative_max_interval(mocker: MockFixture) -> None:
+        with pytest.raises(WrongMaxIntervalError):
+            Wait(mocker.Mock(), timeout=1, interval=0.05, is_exponential=True, max_interval=-1)
+
+    @staticmethod
+    def test_negative_spin_threshold(mocker: MockFixture) -> None:
+        with pytest.raises(WrongSpinThresholdError):
+            Wait(mocker.Mock(), timeout=1, interval=0, spin_threshold=-0.01)
+
     @staticmethod
     @pytest.mark.parametrize(
         ("interval", "attempts", "total_interval"),
@@ -130,6 +337,7 @@ class TestWait:
         (
             (0.03, 3, 0.05, 0.13),
             (0.04, 2, 0.06, 0.1),
+            (0.05, 2, 0.03, 0.06),
         ),
     )
     def test_exponential_max_interval(
@@ -198,13 +406,38 @@ class TestWait:
         with pytest.raises(WaiterTimeoutError, match=expected_message):
             waiter.until_is_false()
 
+    @staticmethod
+    def test_timeout_error_attributes(mocker: MockFixture) -> None:
+        results = [1, "2", True]
+        action_mock = mocker.Mock(side_effect=results)
+        waiter = Wait(action_mock, timeout=0, interval=0, max_attempts=len(results), timeout_message="msg", debug=True)
+        with pytest.raises(WaiterTimeoutError) as exc_info:
+            waiter.until_is_false()
+
+        assert exc_info.value.calls_count == len(results)
+        assert exc_info.value.last_result is results[-1]
+        assert exc_info.value.results == results
+        assert exc_info.value.timeout_message == "msg"
+
+    @staticmethod
+    def test_timeout_error_keyword_only() -> None:
+        with pytest.raises(TypeError):
+            WaiterTimeoutError("message")  # type: ignore[call-arg, arg-type]
+
+    @staticmethod
+    def test_timeout_error_pickle() -> None:
+        error = WaiterTimeoutError(calls_count=2, last_result=1, results=[0, 1], timeout_message="message")
+        unpickled_error = pickle.loads(pickle.dumps(error))  # noqa: S301
+        assert str(unpickled_error) == str(error)
+        assert unpickled_error.results == error.results
+
     @staticmethod
     def test_calls_with_no_debug(mocker: MockFixture) -> None:
         results = [0, 1, "", "1", (), (1,), False, None]
         action_mock = mocker.Mock(side_effect=results)
         waiter = Wait(action_mock, timeout=1, interval=0, debug=False)
         waiter.until_is_none()
-        assert waiter._results is None
+        assert not waiter._results
         assert waiter._calls_count == len(results)
 
     @staticmethod
@@ -213,15 +446,46 @@ class TestWait:
         action_mock = mocker.Mock(side_effect=expected_results)
         waiter = Wait(action_mock, timeout=1, interval=0, debug=True)
         waiter.until_is_none()
-        assert waiter._results == expected_results
+        assert list(waiter._results) == expected_results
         assert waiter._calls_count == len(expected_results)
 
         expected_results = [True, None]
         action_mock.side_effect = expected_results
         waiter.until_is_none()
-        assert waiter._results == expected_results
+        assert list(waiter._results) == expected_results
         assert waiter._calls_count == len(expected_results)
 
+    @staticmethod
+    def test_reset(mocker: MockFixture) -> None:
+        action_mock = mocker.Mock(side_effect=(1, None))
+        waiter = Wait(action_mock, timeout=1, interval=0, debug=True)
+        results = waiter._results
+        waiter.until_is_none()
+        waiter._reset()
+        assert waiter._results is results
+        assert list(waiter._results) == []
+        assert waiter._calls_count == 0
+
+    @staticmethod
+    def test_results_maxlen(mocker: MockFixture) -> None:
+        results = [0, 1, "", "1", (), (1,), False, None]
+        results_maxlen = 3
+        action_mock = mocker.Mock(side_effect=results)
+        waiter = Wait(action_mock, timeout=1, interval=0, debug=True, results_maxlen=results_maxlen)
+        waiter.until_is_none()
+        assert list(waiter._results) == results[-results_maxlen:]
+        assert waiter._calls_count == len(results)
+
+    @staticmethod
+    def test_negative_results_maxlen(mocker: MockFixture) -> None:
+        with pytest.raises(WrongResultsMaxlenError):
+            Wait(mocker.Mock(), timeout=1, debug=True, results_maxlen=-1)
+
+    @staticmethod
+    def test_unused_results_maxlen(mocker: MockFixture) -> None:
+        with pytest.raises(UnusedResultsMaxlenError):
+            Wait(mocker.Mock(), timeout=1, debug=False, results_maxlen=1)
+
     @staticmethod
     @pytest.mark.parametrize("value", (1, "1", (1,), True))
     def test_until(mocker: MockFixture, value: Any) -> None:
@@ -360,3 +624,92 @@ class TestWait:
         result = Wait(action_mock, timeout=1, interval=0).until_is_not_none()
         assert result == value
         assert action_mock.call_count == expected_call_count
+
+    @staticmethod
+    def test_async_action(mocker: MockFixture) -> None:
+        expected_call_count = 2
+        action_mock = mocker.AsyncMock(side_effect=(None, 1))
+        result = asyncio.run(AsyncWait(action_mock, "1", timeout=1, interval=0, k="v").until())
+        assert result == 1
+        assert action_mock.await_count == expected_call_count
+        action_mock.assert_awaited_with("1", k="v")
+
+    @staticmethod
+    def test_async_action_with_sync_waiter(mocker: MockFixture) -> None:
+        action_mock = mocker.AsyncMock(return_value=None)
+        with pytest.raises(AsyncActionError):
+            Wait(action_mock, timeout=1, interval=0)
+
+        action_mock.assert_not_called()
+
+    @staticmethod
+    def test_async_spin_threshold(mocker: MockFixture) -> None:
+        with pytest.raises(UnusedSpinThresholdError):
+            AsyncWait(mocker.AsyncMock(), timeout=1, spin_threshold=0.01)
+
+    @staticmethod
+    def test_async_notifiable(mocker: MockFixture) -> None:
+        with pytest.raises(UnusedNotifiableError):
+            AsyncWait(mocker.AsyncMock(), timeout=1, notifiable=True)
+
+    @staticmethod
+    def test_async_timeout(mocker: MockFixture) -> None:
+        timeout = 0.05
+        action_mock = mocker.AsyncMock(return_value=None)
+
+        start = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            asyncio.run(AsyncWait(action_mock, timeout=timeout, interval=0.01).until())
+
+        assert 0 <= time.perf_counter() - start - timeout <= MAX_THRESHOLD
+
+    @staticmethod
+    def test_async_exponential_interval(mocker: MockFixture) -> None:
+        interval, attempts, total_interval = 0.03, 3, 0.21
+        action_mock = mocker.AsyncMock(return_value=False)
+        waiter = AsyncWait(action_mock, timeout=0, max_attempts=attempts, interval=interval, is_exponential=True)
+        start_time = time.perf_counter()
+        with pytest.raises(WaiterTimeoutError):
+            asyncio.run(waiter.until())
+
+        assert 0 <= time.perf_counter() - start_time - total_interval < MAX_THRESHOLD
+
+    @staticmethod
+    def test_async_max_attempts_with_debug(mocker: MockFixture) -> None:
+        results = [1, "2", True]
+        action_mock = mocker.AsyncMock(side_effect=results)
+        waiter = AsyncWait(action_mock, timeout=0, interval=0, max_attempts=len(results), debug=True)
+        with pytest.raises(WaiterTimeoutError) as exc_info:
+            asyncio.run(waiter.until_is_false())
+
+        assert exc_info.value.results == results
+        assert waiter._calls_count == len(results)
+
+    @staticmethod
+    def test_async_exceptions_to_ignore(mocker: MockFixture) -> None:
+        action_mock = mocker.AsyncMock(side_effect=(RuntimeError, True))
+        waiter = AsyncWait(action_mock, timeout=1, interval=0, exceptions_to_ignore=(RuntimeError,))
+        assert asyncio.run(waiter.until_is_true()) is True
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("method", "args", "results", "expected_result"),
+        (
+            ("until_not", (), (1, 0), 0),
+            ("until_equal_to", (10,), (1, 10), 10),
+            ("until_not_equal_to", (10,), (10, 1), 1),
+            ("until_is", (None,), (1, None), None),
+            ("until_is_not", (None,), (None, 1), 1),
+            ("until_is_true", (), (1, True), True),
+            ("until_is_false", (), (0, False), False),
+            ("until_is_none", (), (0, None), None),
+            ("until_is_not_none", (), (None, 0), 0),
+        ),
+    )
+    def test_until_async_methods(
+        mocker: MockFixture, method: str, args: tuple[Any], results: tuple[Any], expected_result: Any
+    ) -> None:
+        action_mock = mocker.AsyncMock(side_effect=results)
+        result = asyncio.run(getattr(AsyncWait(action_mock, timeout=1, interval=0), method)(*args))
+        assert result == expected_result
+        assert action_mock.await_count == len(results)